@@ -1,17 +1,42 @@
 #!/usr/bin/env python3
 import random
-from enum import Enum
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import List, Sequence
 
 # Statt direkter Item-Objekt-Definitionen:
 # from items import ITEMS_DATA
 from items import ITEMS_DATA
 
 
-class MealType(Enum):
-    BREAKFAST = "breakfast"
-    LUNCH = "lunch"
-    DINNER = "dinner"
+class MealType(IntEnum):
+    # IntEnum: Hashing und Vergleiche laufen über den Int-Fast-Path,
+    # und der Wert dient direkt als Bit-Position für die Meal-Maske.
+    BREAKFAST = 0
+    LUNCH = 1
+    DINNER = 2
+
+    @property
+    def label(self) -> str:
+        """Anzeigename, z.B. "breakfast"."""
+        return self.name.lower()
+
+
+# Feste Reihenfolge der Nährwert-Schlüssel; Item._vec und die _totals-Dicts
+# benutzen dieselbe Reihenfolge, damit beim Aufsummieren kein neues Dict
+# pro Portion gebaut werden muss.
+NUTRIENT_KEYS = ("calories", "fat", "carbs", "protein", "fibre", "salt")
+
+# Positionsindizes in NUTRIENT_KEYS-Reihenfolge; die laufenden Totals sind
+# Listen, die positional statt über String-Keys adressiert werden (kein
+# String-Hashing in den Repair-Schleifen). Dicts entstehen nur noch an der
+# Anzeige-Grenze (nutrients()).
+CAL, FAT, CARBS, PROT, FIBRE, SALT = range(6)
+
+# Ein Bit pro MealType; Items tragen eine daraus aufsummierte Bitmaske,
+# damit Meal-Filter mit einem einzigen AND statt Set-Hashing auskommen.
+_MEAL_BITS: dict[MealType, int] = {mt: 1 << mt for mt in MealType}
 
 
 class Item:
@@ -29,6 +54,27 @@ class Item:
         kann die Logik beim Erstellen des Mittagessens eine Rolle inferieren.
     """
 
+    __slots__ = (
+        "name",
+        "calories_per_portion",
+        "fat_per_portion",
+        "carbs_per_portion",
+        "protein_per_portion",
+        "fibre_per_portion",
+        "salt_per_portion",
+        "meal_types",
+        "_meal_mask",
+        "standard_portion_name",
+        "max_portions",
+        "lunch_role",
+        "_vec",
+        "_protein_per_cal",
+        "_step",
+        "_cal_step",
+        "_prot_step",
+        "_carb_score",
+    )
+
     def __init__(
         self,
         name: str,
@@ -38,37 +84,37 @@ class Item:
         protein_per_portion: float | None,
         fibre_per_portion: float | None,
         salt_per_portion: float | None,
-        meal_types: set[MealType] = set(),
+        meal_types: frozenset[MealType] = frozenset(),
         standard_portion_name: str | None = None,
         max_portions: float | None = None,
     ) -> None:
         self.name = name
 
-        # required per-portion values (calories should be provided)
-        self.calories_per_portion = round(float(calories_per_portion), 2)
+        # required per-portion values (calories should be provided);
+        # keine Rundung hier — gerundet wird nur bei der Anzeige (_fmt)
+        self.calories_per_portion = float(calories_per_portion)
         self.fat_per_portion = (
-            round(float(fat_per_portion), 2) if fat_per_portion is not None else None
+            float(fat_per_portion) if fat_per_portion is not None else None
         )
         self.carbs_per_portion = (
-            round(float(carbs_per_portion), 2)
-            if carbs_per_portion is not None
-            else None
+            float(carbs_per_portion) if carbs_per_portion is not None else None
         )
         self.protein_per_portion = (
-            round(float(protein_per_portion), 2)
-            if protein_per_portion is not None
-            else None
+            float(protein_per_portion) if protein_per_portion is not None else None
         )
         self.fibre_per_portion = (
-            round(float(fibre_per_portion), 2)
-            if fibre_per_portion is not None
-            else None
+            float(fibre_per_portion) if fibre_per_portion is not None else None
         )
         self.salt_per_portion = (
-            round(float(salt_per_portion), 2) if salt_per_portion is not None else None
+            float(salt_per_portion) if salt_per_portion is not None else None
         )
 
-        self.meal_types: set[MealType] = meal_types
+        # frozenset: unveränderlich und bei kleinen Mengen schneller als set;
+        # die Bitmaske macht die Membership-Tests zu einem einzelnen AND.
+        self.meal_types: frozenset[MealType] = frozenset(meal_types)
+        self._meal_mask: int = 0
+        for mt in self.meal_types:
+            self._meal_mask |= _MEAL_BITS[mt]
         self.standard_portion_name: str | None = standard_portion_name
 
         # optional: maximum standard portions allowed for this item (per day)
@@ -83,20 +129,45 @@ class Item:
         # lunch_role is optional runtime metadata: "MAIN", "SIDE", or None
         self.lunch_role: str | None = None
 
+        # Nährwerte pro Portion als Vektor in NUTRIENT_KEYS-Reihenfolge.
+        # Fehlende Makros werden als 0.0 abgelegt.
+        self._vec: tuple[float, ...] = (
+            self.calories_per_portion,
+            self.fat_per_portion or 0.0,
+            self.carbs_per_portion or 0.0,
+            self.protein_per_portion or 0.0,
+            self.fibre_per_portion or 0.0,
+            self.salt_per_portion or 0.0,
+        )
+
+        # Konstante Kennzahl pro Item; einmal berechnen statt bei jedem
+        # protein_per_calorie-Aufruf
+        if self.calories_per_portion > 0:
+            self._protein_per_cal: float = (
+                self.protein_per_portion or 0.0
+            ) / self.calories_per_portion
+        else:
+            self._protein_per_cal = 0.0
+
+        # Schrittweite und die pro Schritt hinzukommenden Kalorien/Proteine
+        # sind konstant pro Item; einmal hier statt pro Kandidaten-Scan.
+        self._step: float = self.step_portions()
+        self._cal_step: float = self.calories_per_portion * self._step
+        self._prot_step: float = (self.protein_per_portion or 0.0) * self._step
+
+        # Heuristik-Score der Kalorien-Reparatur (carbs - 2*fat), ebenfalls
+        # konstant pro Item
+        self._carb_score: float = (self.carbs_per_portion or 0.0) - (
+            self.fat_per_portion or 0.0
+        ) * 2.0
+
     def nutrients_for_portions(self, portions: float) -> dict[str, float]:
         """
         Liefert Nährwerte für die angegebene Anzahl Portionen.
         Fehlende Makros werden als 0.0 behandelt.
         """
         p = float(portions)
-        return {
-            "calories": round(self.calories_per_portion * p, 2),
-            "fat": round((self.fat_per_portion or 0.0) * p, 2),
-            "carbs": round((self.carbs_per_portion or 0.0) * p, 2),
-            "protein": round((self.protein_per_portion or 0.0) * p, 2),
-            "fibre": round((self.fibre_per_portion or 0.0) * p, 2),
-            "salt": round((self.salt_per_portion or 0.0) * p, 2),
-        }
+        return {k: v * p for k, v in zip(NUTRIENT_KEYS, self._vec)}
 
     def step_portions(self) -> float:
         """
@@ -114,6 +185,8 @@ class Portion:
     Arbeitet ausschließlich mit `standard_portions`.
     """
 
+    __slots__ = ("item", "portions")
+
     def __init__(self, item: Item, standard_portions: float) -> None:
         self.item = item
         sp = float(standard_portions)
@@ -136,31 +209,79 @@ class Portion:
         return f"Portion({self.item.name}, {self.portions:g} portions)"
 
 
+def _fmt(x: float) -> float:
+    """Rundet einen Nährwert für die Anzeige auf 2 Nachkommastellen."""
+    return round(x, 2)
+
+
 def add_nutrients(a: dict[str, float], b: dict[str, float]) -> dict[str, float]:
-    keys = set(a) | set(b)
-    return {k: round(a.get(k, 0.0) + b.get(k, 0.0), 2) for k in keys}
+    # Das Nährwert-Schema ist fest; die feste Schlüsselfolge erspart die
+    # Set-Vereinigung und hält die Ergebnis-Reihenfolge stabil.
+    return {k: a.get(k, 0.0) + b.get(k, 0.0) for k in NUTRIENT_KEYS}
 
 
 class Meal:
+    __slots__ = ("meal_type", "_bit", "portions", "_totals")
+
     def __init__(self, meal_type: MealType) -> None:
         self.meal_type = meal_type
+        self._bit = _MEAL_BITS[meal_type]
         self.portions: list[Portion] = []
+        # Laufende Summe der Nährwerte, wird in add() mitgeführt,
+        # damit nutrients() nicht jedes Mal alle Portionen neu summieren muss.
+        # Positional (NUTRIENT_KEYS-Reihenfolge) statt Dict: kein String-Hashing
+        # beim Aufsummieren.
+        self._totals: list[float] = [0.0] * 6
 
     def add(self, portion: Portion) -> None:
-        if self.meal_type not in portion.item.meal_types:
+        if not portion.item._meal_mask & self._bit:
             raise ValueError(
-                f"{portion.item.name} is not allowed for {self.meal_type.value}"
+                f"{portion.item.name} is not allowed for {self.meal_type.label}"
             )
         self.portions.append(portion)
+        p = portion.portions
+        totals = self._totals
+        for i, v in enumerate(portion.item._vec):
+            totals[i] += v * p
 
     def nutrients(self) -> dict[str, float]:
-        total: dict[str, float] = {}
-        for p in self.portions:
-            total = add_nutrients(total, p.nutrients())
-        return total
+        # Dict nur an der Grenze nach außen bauen; intern bleibt alles positional.
+        return dict(zip(NUTRIENT_KEYS, self._totals))
 
     def __repr__(self) -> str:
-        return f"Meal({self.meal_type}, portions={self.portions})"
+        return f"Meal({self.meal_type.name}, portions={self.portions})"
+
+
+def _make_score(
+    calories_target: float,
+    protein_min: float,
+    fat_max: float | None,
+    carbs_min: float | None,
+):
+    """
+    Erzeugt eine auf die Goals zugeschnittene Score-Funktion über den
+    Nährwert-Totals. Die optionalen Grenzen werden einmalig auf neutrale
+    Werte (±inf) aufgelöst, so dass pro Aufruf keine None-Checks mehr
+    anfallen und alle Konstanten als Closure-Locals gebunden sind.
+    """
+    fat_cap = fat_max if fat_max is not None else float("inf")
+    carbs_floor = carbs_min if carbs_min is not None else float("-inf")
+
+    def score_fn(t: list[float]) -> float:
+        # Branchenfrei: max(0, ...) statt datenabhängiger Verzweigungen.
+        # Strafterme: Calories-Abweichung (absolut), Protein unterschritten
+        # (quadratisch = härter), Fett zu hoch, Carbs zu niedrig — die
+        # letzten beiden sind durch die neutralen ±inf-Grenzen automatisch 0,
+        # wenn kein Limit gesetzt ist. `t` sind positionale Totals
+        # (NUTRIENT_KEYS-Reihenfolge).
+        return (
+            abs(calories_target - t[CAL])
+            + max(0.0, protein_min - t[PROT]) ** 2 * 3.0
+            + max(0.0, t[FAT] - fat_cap) ** 2 * 2.0
+            + max(0.0, carbs_floor - t[CARBS]) ** 2 * 1.5
+        )
+
+    return score_fn
 
 
 class Goals:
@@ -175,69 +296,165 @@ class Goals:
         self.protein_min = float(protein_min)
         self.fat_max = float(fat_max) if fat_max is not None else None
         self.carbs_min = float(carbs_min) if carbs_min is not None else None
+        # Spezialisierte Score-Funktion, einmalig pro Goals-Instanz gebaut
+        self._score = _make_score(
+            self.calories_target, self.protein_min, self.fat_max, self.carbs_min
+        )
+
+    # Closures sind nicht picklebar (generate_best_day_plan schickt Goals an
+    # Worker-Prozesse); beim Entpickeln wird die Score-Funktion neu gebaut.
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_score"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._score = _make_score(
+            self.calories_target, self.protein_min, self.fat_max, self.carbs_min
+        )
 
 
 class DayPlan:
+    __slots__ = ("meals", "_totals", "_item_totals", "_lunch_items")
+
     def __init__(self) -> None:
-        self.meals: dict[MealType, Meal] = {
-            MealType.BREAKFAST: Meal(MealType.BREAKFAST),
-            MealType.LUNCH: Meal(MealType.LUNCH),
-            MealType.DINNER: Meal(MealType.DINNER),
-        }
+        # Liste statt Dict: der IntEnum-Wert von MealType ist direkt der
+        # Index, damit entfällt das Enum-Hashing bei jedem Zugriff.
+        self.meals: list[Meal] = [Meal(mt) for mt in MealType]
+        # Laufende Tagessumme, analog zu Meal._totals (O(1)-Abfrage statt
+        # kompletter Neuberechnung in den Repair-Schleifen), positional in
+        # NUTRIENT_KEYS-Reihenfolge.
+        self._totals: list[float] = [0.0] * 6
+        # Portionssumme pro Item über den ganzen Tag, damit der
+        # max_portions-Check nicht alle Portionen durchlaufen muss.
+        self._item_totals: dict[Item, float] = {}
+        # Items, die bereits im Lunch vorkommen (inkrementell gepflegt,
+        # statt die Lunch-Portionen bei Bedarf neu zu durchlaufen).
+        self._lunch_items: set[Item] = set()
+
+    def item_portions(self, item: Item) -> float:
+        """Bisher geplante Standard-Portionen des Items über alle Mahlzeiten."""
+        return self._item_totals.get(item, 0.0)
 
     def add(self, meal_type: MealType, portion: Portion) -> None:
         # Enforce item-level max_portions across the whole DayPlan (per day)
         maxp = getattr(portion.item, "max_portions", None)
+        current_total = self._item_totals.get(portion.item, 0.0)
         if maxp is not None:
-            current_total = 0.0
-            for meal in self.meals.values():
-                for p in meal.portions:
-                    if p.item is portion.item:
-                        current_total += p.portions
             if current_total + portion.portions > maxp:
                 raise ValueError(
                     f"Cannot add {portion.portions} portions of {portion.item.name}: would exceed max_portions ({maxp})"
                 )
         self.meals[meal_type].add(portion)
+        self._item_totals[portion.item] = current_total + portion.portions
+        if meal_type is MealType.LUNCH:
+            self._lunch_items.add(portion.item)
+        p = portion.portions
+        totals = self._totals
+        for i, v in enumerate(portion.item._vec):
+            totals[i] += v * p
+
+    def _push(self, meal_type: MealType, item: Item, portions: float) -> None:
+        """
+        Schneller Pfad für die Repair-Schleifen: die Kandidaten kommen aus
+        den vorgefilterten Meal-Pools und die Auswahl-Kernel haben
+        max_portions bereits geprüft, daher entfallen die Validierungen aus
+        Portion.__init__, Meal.add und add. Öffentliche Aufrufer benutzen
+        weiterhin add().
+        """
+        p = Portion.__new__(Portion)
+        p.item = item
+        p.portions = portions
+        meal = self.meals[meal_type]
+        meal.portions.append(p)
+        meal_totals = meal._totals
+        totals = self._totals
+        for i, v in enumerate(item._vec):
+            added = v * portions
+            meal_totals[i] += added
+            totals[i] += added
+        self._item_totals[item] = self._item_totals.get(item, 0.0) + portions
+        if meal_type is MealType.LUNCH:
+            self._lunch_items.add(item)
 
     def nutrients(self) -> dict[str, float]:
-        total: dict[str, float] = {}
-        for meal in self.meals.values():
-            total = add_nutrients(total, meal.nutrients())
-        return total
+        return dict(zip(NUTRIENT_KEYS, self._totals))
+
+    def calories(self) -> float:
+        """Aktuelle Tageskalorien als Skalar (ohne Dict-Aufbau)."""
+        return self._totals[CAL]
+
+    def protein(self) -> float:
+        """Aktuelles Tagesprotein als Skalar (ohne Dict-Aufbau)."""
+        return self._totals[PROT]
 
     def score(self, goals: Goals) -> float:
         """
         Kleiner Score: 0 ist perfekt, größer ist schlechter.
         (Einfaches "Abweichung minimieren" – später kannst du das tunen.)
         """
-        n = self.nutrients()
-
-        cal = n.get("calories", 0.0)
-        protein = n.get("protein", 0.0)
-        fat = n.get("fat", 0.0)
-        carbs = n.get("carbs", 0.0)
-
-        # Strafpunkte: Calories-Abweichung (absolut)
-        score = abs(goals.calories_target - cal)
+        return goals._score(self._totals)
 
-        # Strafpunkte: Protein unterschritten (quadratisch = härter)
-        if protein < goals.protein_min:
-            score += (goals.protein_min - protein) ** 2 * 3.0
 
-        # Optional: Fett zu hoch
-        if goals.fat_max is not None and fat > goals.fat_max:
-            score += (fat - goals.fat_max) ** 2 * 2.0
-
-        # Optional: Carbs zu niedrig
-        if goals.carbs_min is not None and carbs < goals.carbs_min:
-            score += (goals.carbs_min - carbs) ** 2 * 1.5
+def items_for_meal(items: List[Item], meal_type: MealType) -> List[Item]:
+    bit = _MEAL_BITS[meal_type]
+    return [i for i in items if i._meal_mask & bit]
 
-        return round(score, 2)
 
+@dataclass(frozen=True)
+class ItemCatalog:
+    """
+    Eingefrorene, vorverarbeitete Sicht auf einen Item-Katalog: die Pools je
+    Mahlzeit, die Protein-Kandidaten (>5 g Protein pro Portion) und die
+    zugehörigen Kandidaten-Arrays für die Repair-Schleifen. Hängt nur vom
+    Katalog ab und kann über beliebig viele Planer/Seeds wiederverwendet
+    werden; pro Plan müssen nur noch die Lunch-beschränkten Varianten
+    gebaut werden.
+    """
 
-def items_for_meal(items: List[Item], meal_type: MealType) -> List[Item]:
-    return [i for i in items if meal_type in i.meal_types]
+    items: tuple[Item, ...]
+    pools: dict[MealType, tuple[Item, ...]]
+    protein_pools: dict[MealType, tuple[Item, ...]]
+    fill_pools: dict[MealType, tuple[Item, ...]]
+    fill_arrays: dict[MealType, "CandidateArrays"]
+    protein_arrays: dict[MealType, "CandidateArrays"]
+
+    @classmethod
+    def from_items(cls, items: List[Item]) -> "ItemCatalog":
+        pools = {mt: tuple(items_for_meal(items, mt)) for mt in MealType}
+        # Absteigend nach Protein-Dichte vorsortiert: die Protein-Reparatur
+        # kann dann beim ersten zulässigen Kandidaten abbrechen, statt jedes
+        # Mal den kompletten Pool per argmax zu durchlaufen. sorted() ist
+        # stabil, daher bleibt bei gleicher Dichte die Katalog-Reihenfolge
+        # (und damit die bisherige Tie-Break-Semantik) erhalten.
+        protein_pools = {
+            mt: tuple(
+                sorted(
+                    (
+                        it
+                        for it in pools[mt]
+                        if (it.protein_per_portion or 0.0) > 5
+                    ),
+                    key=_protein_density,
+                    reverse=True,
+                )
+            )
+            for mt in MealType
+        }
+        # Analog für die Kalorien-Reparatur: absteigend nach Carb-Heuristik
+        # sortiert, damit _best_carb_index beim ersten zulässigen Kandidaten
+        # stoppen kann. `pools` selbst bleibt in Katalog-Reihenfolge, weil
+        # die Basis-Auswahl (rng.choice) davon abhängt.
+        fill_pools = {
+            mt: tuple(sorted(pools[mt], key=_carb_priority, reverse=True))
+            for mt in MealType
+        }
+        fill_arrays = {mt: _candidate_arrays(fill_pools[mt]) for mt in MealType}
+        protein_arrays = {mt: _candidate_arrays(protein_pools[mt]) for mt in MealType}
+        return cls(
+            tuple(items), pools, protein_pools, fill_pools, fill_arrays, protein_arrays
+        )
 
 
 def default_portions(item: Item) -> float:
@@ -248,18 +465,116 @@ def default_portions(item: Item) -> float:
 def protein_per_calorie(item: Item) -> float:
     """
     Proteingehalt pro Kalorie, basierend auf per-portion Daten.
+    (Konstant pro Item, wird bei der Konstruktion vorberechnet.)
+    """
+    return item._protein_per_cal
+
+
+# Parallele Kandidaten-Listen (SoA-Layout): Items, Schrittweite, Kalorien
+# bzw. Protein pro Schritt und der Carb-Heuristik-Score.
+CandidateArrays = tuple[
+    Sequence[Item], list[float], list[float], list[float], list[float]
+]
+
+
+def _protein_density(item: Item) -> float:
+    """Protein pro zusätzlicher Kalorie eines Schritts (Sortierschlüssel)."""
+    if item._cal_step > 0:
+        return item._prot_step / item._cal_step
+    return float("-inf")
+
+
+def _carb_priority(item: Item) -> float:
+    """Carb-Heuristik-Score (Sortierschlüssel der Kalorien-Reparatur)."""
+    return item._carb_score
+
+
+def _candidate_arrays(pool: Sequence[Item]) -> CandidateArrays:
+    """
+    Legt die in den Repair-Schleifen benötigten Kennzahlen eines Pools als
+    parallele Listen ab. So wird die Kandidaten-Auswahl zu einem reinen
+    Index-Scan ohne Attributzugriffe und Neuberechnungen.
+    """
+    steps = [it._step for it in pool]
+    cal_steps = [it._cal_step for it in pool]
+    prot_steps = [it._prot_step for it in pool]
+    carb_scores = [it._carb_score for it in pool]
+    return pool, steps, cal_steps, prot_steps, carb_scores
+
+
+def _best_protein_index(
+    arrays: CandidateArrays,
+    item_totals: dict[Item, float],
+    current_cal: float,
+    cal_limit: float,
+) -> int:
     """
-    calories = item.calories_per_portion
-    protein = item.protein_per_portion or 0.0
+    Kern der Protein-Reparatur: Index des Kandidaten mit dem meisten Protein
+    pro zusätzlicher Kalorie, der weder cal_limit noch max_portions verletzt.
+    -1, wenn kein Kandidat passt.
 
-    if calories <= 0:
-        return 0.0
-    return protein / calories
+    Die Protein-Pools sind absteigend nach Protein-Dichte vorsortiert
+    (ItemCatalog.from_items); der erste zulässige Kandidat ist damit das
+    argmax über alle zulässigen, und die Schleife kann sofort abbrechen.
+    """
+    cand_items, steps, cal_steps, _, _ = arrays
+    for i in range(len(cand_items)):
+        it = cand_items[i]
+        # respect item-level max_portions against current plan
+        maxp = it.max_portions
+        if maxp is not None and item_totals.get(it, 0.0) + steps[i] > maxp:
+            continue
+        added_cal = cal_steps[i]
+        if added_cal <= 0:
+            continue
+        if current_cal + added_cal > cal_limit:
+            continue
+        return i
+    return -1
+
+
+def _best_carb_index(
+    arrays: CandidateArrays, item_totals: dict[Item, float]
+) -> tuple[int, float]:
+    """
+    Kern der Kalorien-Reparatur: Index und Score des Kandidaten mit dem
+    höchsten Carb-Heuristik-Score, der max_portions respektiert.
+    (-1, 0.0), wenn kein Kandidat passt.
+
+    Die Fill-Pools sind absteigend nach Carb-Score vorsortiert
+    (ItemCatalog.from_items); der erste zulässige Kandidat ist das argmax.
+    """
+    cand_items, steps, _, _, carb_scores = arrays
+    for i in range(len(cand_items)):
+        it = cand_items[i]
+        maxp = it.max_portions
+        if maxp is not None and item_totals.get(it, 0.0) + steps[i] > maxp:
+            continue
+        return i, carb_scores[i]
+    return -1, 0.0
+
+
+def partition_lunch_roles(pool: Sequence[Item]) -> tuple[List[Item], List[Item]]:
+    """
+    Teilt einen Lunch-Pool nach expliziter Rolle auf (mains, sides).
+    Die Rollen stehen nach dem Laden fest, daher reicht eine einmalige
+    Partitionierung pro Pool statt vier List-Comprehensions pro
+    pick_lunch_pair-Aufruf.
+    """
+    mains = [i for i in pool if i.lunch_role == "MAIN"]
+    sides = [i for i in pool if i.lunch_role == "SIDE"]
+    return mains, sides
 
 
-def pick_lunch_pair(rng: random.Random, pool: List[Item]) -> tuple[Item, Item]:
+def pick_lunch_pair(
+    rng: random.Random,
+    pool: Sequence[Item],
+    mains: List[Item],
+    sides: List[Item],
+) -> tuple[Item, Item]:
     """
-    Wählt ein Lunch-Paar (main, side) aus dem Pool aus.
+    Wählt ein Lunch-Paar (main, side) aus dem Pool aus. `mains`/`sides`
+    sind die vorab partitionierten expliziten Rollen (partition_lunch_roles).
 
     Regeln:
       - Das Ergebnis muss genau ein MAIN und genau ein SIDE liefern.
@@ -271,9 +586,6 @@ def pick_lunch_pair(rng: random.Random, pool: List[Item]) -> tuple[Item, Item]:
         inferiere MAIN/SIDE nach Kalorien (höhere Kalorien = MAIN).
       - Wenn nur ein Item verfügbar ist, verwende es doppelt (main==side).
     """
-    mains = [i for i in pool if getattr(i, "lunch_role", None) == "MAIN"]
-    sides = [i for i in pool if getattr(i, "lunch_role", None) == "SIDE"]
-
     # Case A: both explicit mains and sides -> pick one each
     if mains and sides:
         main = rng.choice(mains)
@@ -318,7 +630,12 @@ def pick_lunch_pair(rng: random.Random, pool: List[Item]) -> tuple[Item, Item]:
             return other, side
 
     # Case D: no explicit roles -> choose two distinct items if possible
-    unique_pool = list(dict.fromkeys(pool))  # preserve order but unique
+    # Dedup über id() in einem Durchlauf (reihenfolge-erhaltend, ohne den
+    # Dict+List-Umweg von dict.fromkeys)
+    seen: set[int] = set()
+    unique_pool = [
+        i for i in pool if not (id(i) in seen or seen.add(id(i)))
+    ]
     if len(unique_pool) >= 2:
         a, b = rng.sample(unique_pool, 2)
         # infer roles by calories (higher = MAIN)
@@ -341,212 +658,252 @@ def pick_lunch_pair(rng: random.Random, pool: List[Item]) -> tuple[Item, Item]:
     raise ValueError("No lunch candidates available")
 
 
-def generate_day_plan(
-    items: List[Item], goals: Goals, seed: int | None = None
-) -> DayPlan:
-    rng = random.Random(seed)
-    plan = DayPlan()
-
-    # Kalorien-Limit (nicht mehr als target + 100 kcal)
-    cal_limit = goals.calories_target + 100.0
-
-    # 1) Basis: je Mahlzeit Startportionen
-    # Breakfast and dinner: jeweils ein Gericht
-    for mt in [MealType.BREAKFAST, MealType.DINNER]:
-        pool = items_for_meal(items, mt)
-        if not pool:
-            raise ValueError(f"No items for meal type {mt}")
-        it = rng.choice(pool)
-        plan.add(mt, Portion(it, standard_portions=default_portions(it)))
-
-    # Lunch: Baue aus MAIN + SIDE
-    lunch_pool = items_for_meal(items, MealType.LUNCH)
+def make_planner(items: List[Item], goals: Goals):
+    """
+    Spezialisiert den Planer auf einen festen Katalog und feste Goals.
+
+    Alle konfigurations-abhängigen Konstanten — Pools, Kandidaten-Arrays,
+    Lunch-Partitionen, cal_limit, protein_min — werden hier einmalig
+    berechnet und als Closure-Locals gebunden; der zurückgegebene Planer
+    erledigt pro Seed nur noch die eigentliche Suche. Das lohnt sich überall
+    dort, wo viele Pläne für dieselbe Konfiguration erzeugt werden
+    (Seed-Sweeps, Multi-Start).
+    """
+    # Katalog einmalig vorverarbeiten statt in jeder Repair-Iteration neu zu
+    # filtern (die Item-Liste ändert sich während der Planung nicht).
+    catalog = ItemCatalog.from_items(items)
+    pools = catalog.pools
+    base_fill_arrays = catalog.fill_arrays
+    base_protein_arrays = catalog.protein_arrays
+    for mt in (MealType.BREAKFAST, MealType.DINNER):
+        if not pools[mt]:
+            raise ValueError(f"No items for meal type {mt.label}")
+    lunch_pool = pools[MealType.LUNCH]
     if not lunch_pool:
         raise ValueError("No items for lunch available")
-    main_item, side_item = pick_lunch_pair(rng, lunch_pool)
+    lunch_mains, lunch_sides = partition_lunch_roles(lunch_pool)
 
-    # Wenn main==side (nur ein Item im Pool), fügen wir zwei Portionen derselben Item hinzu.
-    plan.add(
-        MealType.LUNCH,
-        Portion(main_item, standard_portions=default_portions(main_item)),
-    )
-    plan.add(
-        MealType.LUNCH,
-        Portion(side_item, standard_portions=default_portions(side_item)),
-    )
+    breakfast_pool = pools[MealType.BREAKFAST]
+    dinner_pool = pools[MealType.DINNER]
+    lunch_protein_all = catalog.protein_pools[MealType.LUNCH]
+    lunch_fill_all = catalog.fill_pools[MealType.LUNCH]
 
-    def add_best_item(mt: MealType, candidates: List[Item], cal_limit: float) -> bool:
-        """
-        Versucht, einen Schritt (step_portions) des besten Kandidaten zu mt hinzuzufügen,
-        wobei darauf geachtet wird, das gegebene Kalorien-Limit nicht zu überschreiten
-        und item.max_portions zu respektieren.
-        Bewertungs-Kriterium: zusätzliches Protein pro zusätzlicher Kalorie.
-        Gibt True zurück, wenn etwas hinzugefügt wurde, sonst False.
-        """
-        current_cal = plan.nutrients().get("calories", 0.0)
-        best = None
-        best_score = -1.0
-
-        for it in candidates:
-            step = it.step_portions()
-            # respect item-level max_portions against current plan
-            maxp = getattr(it, "max_portions", None)
-            if maxp is not None:
-                current_item_total = 0.0
-                for meal in plan.meals.values():
-                    for p in meal.portions:
-                        if p.item is it:
-                            current_item_total += p.portions
-                if current_item_total + step > maxp:
-                    # would exceed the allowed maximum for this item; skip
+    # Goal-Konstanten als Locals (LOAD_FAST in den Schleifen)
+    calories_target = goals.calories_target
+    protein_min = goals.protein_min
+    # Kalorien-Limit (nicht mehr als target + 100 kcal)
+    cal_limit = calories_target + 100.0
+
+    protein_repair_order = (MealType.DINNER, MealType.BREAKFAST, MealType.LUNCH)
+    fill_order = (MealType.BREAKFAST, MealType.DINNER, MealType.LUNCH)
+
+    def plan_day(seed: int | None = None) -> DayPlan:
+        rng = random.Random(seed)
+        plan = DayPlan()
+
+        # 1) Basis: je Mahlzeit Startportionen
+        # Breakfast and dinner: jeweils ein Gericht
+        for mt, pool in (
+            (MealType.BREAKFAST, breakfast_pool),
+            (MealType.DINNER, dinner_pool),
+        ):
+            it = rng.choice(pool)
+            plan.add(mt, Portion(it, standard_portions=default_portions(it)))
+
+        # Lunch: Baue aus MAIN + SIDE
+        main_item, side_item = pick_lunch_pair(
+            rng, lunch_pool, lunch_mains, lunch_sides
+        )
+
+        # Wenn main==side (nur ein Item im Pool), fügen wir zwei Portionen derselben Item hinzu.
+        plan.add(
+            MealType.LUNCH,
+            Portion(main_item, standard_portions=default_portions(main_item)),
+        )
+        plan.add(
+            MealType.LUNCH,
+            Portion(side_item, standard_portions=default_portions(side_item)),
+        )
+
+        # Lunch erhält in den Repair-Schleifen keine neuen Items, nur
+        # zusätzliche Portionen der bereits gewählten. Nur die Lunch-Einträge
+        # hängen vom konkreten Plan ab; alles andere kommt fertig aus
+        # dem ItemCatalog.
+        existing_lunch = plan._lunch_items
+        protein_arrays = dict(base_protein_arrays)
+        protein_arrays[MealType.LUNCH] = _candidate_arrays(
+            [it for it in lunch_protein_all if it in existing_lunch]
+        )
+        fill_arrays = dict(base_fill_arrays)
+        fill_arrays[MealType.LUNCH] = _candidate_arrays(
+            [it for it in lunch_fill_all if it in existing_lunch]
+        )
+
+        def add_best_item(
+            mt: MealType, arrays: CandidateArrays, current_cal: float
+        ) -> bool:
+            """
+            Versucht, einen Schritt (step_portions) des besten Kandidaten zu mt hinzuzufügen,
+            wobei darauf geachtet wird, das gegebene Kalorien-Limit nicht zu überschreiten
+            und item.max_portions zu respektieren.
+            Bewertungs-Kriterium: zusätzliches Protein pro zusätzlicher Kalorie.
+            Gibt True zurück, wenn etwas hinzugefügt wurde, sonst False.
+            """
+            best_i = _best_protein_index(arrays, item_totals, current_cal, cal_limit)
+            if best_i < 0:
+                return False
+
+            plan._push(mt, arrays[0][best_i], arrays[1][best_i])
+            return True
+
+        # Lokale Aliase für die innersten Schleifen (erspart wiederholte
+        # Attribut-/Dict-Zugriffe pro Iteration)
+        totals = plan._totals
+        item_totals = plan._item_totals
+
+        # 2) Protein-Repair (gezielt), respektiere cal_limit
+        # Hinweis: Ursprünglich war Lunch unverändert, aber in dieser Variante erlauben
+        # Reparatur-Schritte auch zusätzliche Lunch-Portionen. Daher betrachten wir Breakfast, Lunch und Dinner.
+        for _ in range(200):
+            if totals[PROT] >= protein_min:
+                break
+
+            current_cal = totals[CAL]
+            # Wenn bereits über dem Limit, brechen wir ab (nicht weiter erhöhen)
+            if current_cal > cal_limit:
+                break
+
+            added = False
+            # Versuche für verschiedene Mahlzeiten, etwas hinzuzufügen.
+            # Wenn wir Lunch betrachten, dürfen wir nur zusätzliche Portionen von Items
+            # hinzufügen, die bereits in der Lunch-Mahlzeit vorhanden sind (keine neuen Lunch-Items).
+            for mt in protein_repair_order:
+                # Kandidaten: Items mit "vernünftigem" Protein (per portion);
+                # wenn Lunch: nur bereits vorhandene Lunch-Items erlauben
+                if not protein_arrays[mt][0]:
                     continue
+                if add_best_item(mt, protein_arrays[mt], current_cal):
+                    added = True
+                    break
 
-            added_cal = it.calories_per_portion * step
-            if added_cal <= 0:
-                continue
-            # Prüfe, ob Hinzufügen das Kalorien-Limit überschreiten würde
-            if current_cal + added_cal > cal_limit:
-                continue
-            added_protein = (it.protein_per_portion or 0.0) * step
-            # Score: protein per added calorie
-            s = added_protein / added_cal if added_cal > 0 else 0.0
-            if s > best_score:
-                best_score = s
-                best = it
-
-        if best is None:
-            return False
-
-        plan.add(mt, Portion(best, standard_portions=best.step_portions()))
-        return True
-
-    # 2) Protein-Repair (gezielt), respektiere cal_limit
-    # Hinweis: Ursprünglich war Lunch unverändert, aber in dieser Variante erlauben
-    # Reparatur-Schritte auch zusätzliche Lunch-Portionen. Daher betrachten wir Breakfast, Lunch und Dinner.
-    for _ in range(200):
-        n = plan.nutrients()
-        if n.get("protein", 0.0) >= goals.protein_min:
-            break
-
-        current_cal = n.get("calories", 0.0)
-        # Wenn bereits über dem Limit, brechen wir ab (nicht weiter erhöhen)
-        if current_cal > cal_limit:
-            break
-
-        added = False
-        # Versuche für verschiedene Mahlzeiten, etwas hinzuzufügen.
-        # Wenn wir Lunch betrachten, dürfen wir nur zusätzliche Portionen von Items
-        # hinzufügen, die bereits in der Lunch-Mahlzeit vorhanden sind (keine neuen Lunch-Items).
-        for mt in [MealType.DINNER, MealType.BREAKFAST, MealType.LUNCH]:
-            pool = items_for_meal(items, mt)
-            # Wenn Lunch: nur bereits vorhandene Lunch-Items erlauben
-            if mt is MealType.LUNCH:
-                existing = [p.item for p in plan.meals[MealType.LUNCH].portions]
-                pool = [it for it in pool if it in existing]
-            # Kandidaten: Items mit "vernünftigem" Protein (per portion)
-            pool = [it for it in pool if (it.protein_per_portion or 0.0) > 5]
-            if not pool:
-                continue
-            if add_best_item(mt, pool, cal_limit):
-                added = True
+            if not added:
+                # Kein Kandidat passt mehr ins Kalorien-Limit oder keine geeigneten Items
                 break
 
-        if not added:
-            # Kein Kandidat passt mehr ins Kalorien-Limit oder keine geeigneten Items
-            break
-
-    # 3) Kalorien-Repair (auffüllen)
-    for _ in range(80):
-        n = plan.nutrients()
-        cal = n.get("calories", 0.0)
-
-        # Stoppen, wenn wir nahe genug am Ziel sind (±100)
-        if abs(cal - goals.calories_target) <= 100:
-            break
-        if cal > goals.calories_target + 100:
-            break  # zu hoch, wir reduzieren nicht in diesem MVP
-
-        # Fülle bevorzugt mit Carb-lastigen Sachen (Reis/Haferflocken)
-        # Heuristik: max carbs_per_portion bei moderatem Fett
-        all_candidates: list[tuple[MealType, Item]] = []
-        # Fülle Breakfast, Dinner und Lunch — Lunch kann hier ebenfalls ergänzt werden,
-        # jedoch nur durch bereits vorhandene Lunch-Items (keine neuen Lunch-Items).
-        for mt in [MealType.BREAKFAST, MealType.DINNER, MealType.LUNCH]:
-            pool = items_for_meal(items, mt)
-            # Wenn Lunch: nur bereits vorhandene Lunch-Items erlauben
-            if mt is MealType.LUNCH:
-                existing = [p.item for p in plan.meals[MealType.LUNCH].portions]
-                pool = [it for it in pool if it in existing]
-            for it in pool:
-                # Prüfe, ob das Item durch einen Schritt das max_portions Limit verletzen würde
-                step = it.step_portions()
-                maxp = getattr(it, "max_portions", None)
-                current_item_total = 0.0
-                for meal in plan.meals.values():
-                    for p in meal.portions:
-                        if p.item is it:
-                            current_item_total += p.portions
-                if maxp is not None and current_item_total + step > maxp:
-                    continue  # überspringe dieses Item
-                all_candidates.append((mt, it))
-
-        if not all_candidates:
-            break
-
-        # pick best carb-heavy item
-        best_mt, best_it = all_candidates[0]
-
-        def carbs_per_portion_val(it: Item) -> float:
-            return it.carbs_per_portion or 0.0
-
-        def fat_per_portion_val(it: Item) -> float:
-            return it.fat_per_portion or 0.0
-
-        best_score = carbs_per_portion_val(best_it) - fat_per_portion_val(best_it) * 2.0
-
-        for mt, it in all_candidates[1:]:
-            s = carbs_per_portion_val(it) - fat_per_portion_val(it) * 2.0
-            if s > best_score:
-                best_score = s
-                best_mt, best_it = mt, it
-
-        # Nur hinzufügen, wenn wir das cal_limit nicht überschreiten und nicht max_portions verletzen
-        added_cal = best_it.calories_per_portion * best_it.step_portions()
-        if cal + added_cal <= cal_limit:
-            plan.add(
-                best_mt, Portion(best_it, standard_portions=best_it.step_portions())
-            )
-        else:
-            # wenn das beste Item das Limit sprengt, versuchen wir eine andere Runde:
-            # hier einfach abbrechen, um keine Überschreitung zu riskieren
-            break
+        # 3) Kalorien-Repair (auffüllen)
+        for _ in range(80):
+            cal = totals[CAL]
+
+            # Stoppen, wenn wir nahe genug am Ziel sind (±100)
+            if abs(cal - calories_target) <= 100:
+                break
+            if cal > calories_target + 100:
+                break  # zu hoch, wir reduzieren nicht in diesem MVP
+
+            # Fülle bevorzugt mit Carb-lastigen Sachen (Reis/Haferflocken)
+            # Heuristik: max carbs_per_portion bei moderatem Fett (vorberechneter
+            # carb_score). Fülle Breakfast, Dinner und Lunch — Lunch kann hier
+            # ebenfalls ergänzt werden, jedoch nur durch bereits vorhandene
+            # Lunch-Items (keine neuen Lunch-Items).
+            # Auswahl als ein Optional-Tupel (meal, item, step, added_cal),
+            # damit ein einziger None-Check alle vier Werte narrowt.
+            best: tuple[MealType, Item, float, float] | None = None
+            best_score = 0.0
+            for mt in fill_order:
+                arrays = fill_arrays[mt]
+                i, s = _best_carb_index(arrays, item_totals)
+                if i < 0:
+                    continue
+                if best is None or s > best_score:
+                    best_score = s
+                    best = (mt, arrays[0][i], arrays[1][i], arrays[2][i])
+
+            if best is None:
+                break
+            best_mt, best_it, best_step, best_added_cal = best
+
+            # Nur hinzufügen, wenn wir das cal_limit nicht überschreiten und nicht max_portions verletzen
+            if cal + best_added_cal <= cal_limit:
+                plan._push(best_mt, best_it, best_step)
+            else:
+                # wenn das beste Item das Limit sprengt, versuchen wir eine andere Runde:
+                # hier einfach abbrechen, um keine Überschreitung zu riskieren
+                break
+
+        return plan
 
-    return plan
+    return plan_day
+
+
+def generate_day_plan(
+    items: List[Item], goals: Goals, seed: int | None = None
+) -> DayPlan:
+    """Einmal-Aufruf: baut den spezialisierten Planer und führt ihn aus."""
+    return make_planner(items, goals)(seed)
+
+
+def _scored_plan(args: tuple[List[Item], Goals, int]) -> tuple[float, DayPlan]:
+    """Worker für generate_best_day_plan: ein Plan plus sein Score."""
+    items, goals, seed = args
+    plan = generate_day_plan(items, goals, seed=seed)
+    return plan.score(goals), plan
+
+
+def generate_best_day_plan(
+    items: List[Item],
+    goals: Goals,
+    n_starts: int = 8,
+    seeds: list[int] | None = None,
+    master_seed: int = 0,
+) -> DayPlan:
+    """
+    Mehrfachstart-Variante von generate_day_plan: erzeugt unabhängige Pläne
+    mit deterministischen Seeds (master_seed + i) parallel in
+    Worker-Prozessen und liefert den Plan mit dem kleinsten Score zurück.
+
+    Der Generator ist eine stochastische lokale Suche — mehrere Starts
+    entkommen lokalen Optima deutlich günstiger als mehr Iterationen
+    innerhalb eines einzelnen Starts.
+    """
+    if seeds is None:
+        seeds = [master_seed + i for i in range(n_starts)]
+    if not seeds:
+        raise ValueError("seeds must not be empty")
+
+    with ProcessPoolExecutor() as executor:
+        results = list(
+            executor.map(_scored_plan, [(items, goals, s) for s in seeds])
+        )
+    _, best_plan = min(results, key=lambda r: r[0])
+    return best_plan
 
 
 def load_items_from_data(data) -> List[Item]:
+    # Ein Durchlauf pro Zeile; get einmal binden statt es pro Feld neu über
+    # das Dict aufzulösen. Die MealType-Auflösung geht über die (gecachte)
+    # Enum-__getitem__-Tabelle.
     result: List[Item] = []
+    meal_type_for = MealType.__getitem__
     for d in data:
-        # meal_types als Menge von MealType-Enums erzeugen
-        mts = {MealType[mt] for mt in d.get("meal_types", [])}
+        get = d.get
 
         item = Item(
             d["name"],
             # per-portion (required)
             d["calories_per_portion"],
-            d.get("fat_per_portion"),
-            d.get("carbs_per_portion"),
-            d.get("protein_per_portion"),
-            d.get("fibre_per_portion"),
-            d.get("salt_per_portion"),
-            mts,
-            standard_portion_name=d.get("standard_portion_name"),
-            max_portions=d.get("max_portions"),
+            get("fat_per_portion"),
+            get("carbs_per_portion"),
+            get("protein_per_portion"),
+            get("fibre_per_portion"),
+            get("salt_per_portion"),
+            frozenset(meal_type_for(mt) for mt in get("meal_types", ())),
+            standard_portion_name=get("standard_portion_name"),
+            max_portions=get("max_portions"),
         )
 
         # Optional: lade explizite Lunch-Rolle (wenn in ITEMS_DATA vorhanden).
         # Erwarteter Wert: "MAIN" oder "SIDE" (case-insensitive).
-        lr = d.get("lunch_role")
+        lr = get("lunch_role")
         if lr:
             lr_up = str(lr).upper()
             if lr_up in ("MAIN", "SIDE"):
@@ -556,21 +913,22 @@ def load_items_from_data(data) -> List[Item]:
     return result
 
 
-# Lade Items
-items = load_items_from_data(ITEMS_DATA)
+if __name__ == "__main__":
+    # Lade Items
+    items = load_items_from_data(ITEMS_DATA)
 
-# Beispiel Goals und Ausführung
-goals = Goals(calories_target=1733, protein_min=106, fat_max=56)
+    # Beispiel Goals und Ausführung
+    goals = Goals(calories_target=1733, protein_min=106, fat_max=56)
 
-plan = generate_day_plan(items, goals, seed=42)
+    plan = generate_day_plan(items, goals, seed=42)
 
-print("Day nutrients:", plan.nutrients())
-print("Score:", plan.score(goals))
-for mt, meal in plan.meals.items():
-    # Aggregierte Nährwerte pro Mahlzeit zusätzlich ausgeben
-    mn = meal.nutrients()
-    print(f"{mt.value.capitalize()}:")
-    print("  portions:", meal.portions)
-    print("  nutrients:")
-    for k, v in mn.items():
-        print(f"    {k}: {v}")
+    print("Day nutrients:", {k: _fmt(v) for k, v in plan.nutrients().items()})
+    print("Score:", _fmt(plan.score(goals)))
+    for meal in plan.meals:
+        # Aggregierte Nährwerte pro Mahlzeit zusätzlich ausgeben
+        mn = meal.nutrients()
+        print(f"{meal.meal_type.label.capitalize()}:")
+        print("  portions:", meal.portions)
+        print("  nutrients:")
+        for k, v in mn.items():
+            print(f"    {k}: {_fmt(v)}")
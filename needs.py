@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import Iterable, Literal, Optional
 
 Sex = Literal["male", "female"]
 Goal = Literal["cut", "maintain", "bulk"]
@@ -94,6 +95,36 @@ def compute_targets(
     if fat_g_per_kg <= 0:
         raise ValueError("fat_g_per_kg must be > 0")
 
+    return _compute_targets(
+        weight_kg,
+        height_cm,
+        age_years,
+        sex,
+        activity,
+        goal,
+        goal_delta_kcal,
+        protein_g_per_kg,
+        fat_g_per_kg,
+    )
+
+
+@lru_cache(maxsize=256)
+def _compute_targets(
+    weight_kg: float,
+    height_cm: float,
+    age_years: int,
+    sex: Sex,
+    activity: str,
+    goal: Goal,
+    goal_delta_kcal: Optional[int],
+    protein_g_per_kg: float,
+    fat_g_per_kg: float,
+) -> MacroTargets:
+    """
+    Gecachter Rechenkern von compute_targets (reine Funktion der Argumente).
+    In UI-/Sweep-Szenarien wird dasselbe Profil oft wiederholt angefragt;
+    da MacroTargets frozen ist, kann die gecachte Instanz geteilt werden.
+    """
     # 1) BMR & TDEE
     bmr = mifflin_st_jeor_bmr(
         weight_kg=weight_kg, height_cm=height_cm, age_years=age_years, sex=sex
@@ -138,6 +169,16 @@ def compute_targets(
     )
 
 
+def compute_targets_batch(profiles: Iterable[dict]) -> list[MacroTargets]:
+    """
+    Berechnet MacroTargets für mehrere Profile (z.B. eine Kohorte).
+    Jedes Profil ist ein Dict mit den Keyword-Argumenten von
+    compute_targets. Doppelte Profile treffen den Cache des Rechenkerns
+    und teilen sich dieselbe MacroTargets-Instanz.
+    """
+    return [compute_targets(**profile) for profile in profiles]
+
+
 if __name__ == "__main__":
     # Beispiel: 80 kg, 180 cm, 23, male, moderat aktiv, Erhalt
     targets = compute_targets(